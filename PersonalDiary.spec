@@ -9,8 +9,23 @@ a = Analysis(
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
-    runtime_hooks=[],
-    excludes=[],
+    runtime_hooks=['runtime_hook.py'],
+    excludes=[
+        'unittest',
+        'pydoc',
+        'doctest',
+        'xmlrpc',
+        'http.server',
+        'email',
+        'pytest',
+        'numpy',
+        'matplotlib',
+        'PIL',
+        'setuptools',
+        'pip',
+        'tkinter.test',
+        'test',
+    ],
     noarchive=False,
     optimize=0,
 )
@@ -39,7 +54,12 @@ coll = COLLECT(
     a.datas,
     strip=False,
     upx=True,
-    upx_exclude=[],
+    upx_exclude=[
+        'vcruntime140.dll',
+        'python3*.dll',
+        '_ssl.pyd',
+        '_hashlib.pyd',
+    ],
     name='PersonalDiary',
 )
 app = BUNDLE(
@@ -3,15 +3,28 @@ Authentication module for personal diary application.
 Handles user authentication and password management.
 """
 
+import base64
+import hashlib
+import hmac
 import os
+import secrets
 import sys
-import tkinter as tk
-import tkinter.simpledialog as simpledialog
-import tkinter.messagebox as messagebox
-from pathlib import Path
 
 from diary.crypto import CryptoManager, DecryptionError
 
+# tkinter imports are deferred into the methods that show dialogs so
+# importing this module stays cheap on startup
+
+# scrypt parameters for password hashing (OpenSSL C implementation)
+_SCRYPT_N = 2**14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SCRYPT_DKLEN = 32
+
+# Cache of resolved password-file locations, mirroring the key-path
+# cache in diary.crypto, so repeated construction skips the stat walk
+_RESOLVED_PATHS = {}
+
 
 class AuthManager:
     def __init__(self, crypto_manager=None, password_file=".password.txt"):
@@ -21,8 +34,25 @@ class AuthManager:
         # Resolve path to password file
         self.password_file = self._resolve_path(password_file)
 
+        # Ensure the password file's directory exists once here rather
+        # than on every save
+        from pathlib import Path
+
+        self._parent_dir = Path(self.password_file).resolve().parent
+        self._parent_dir.mkdir(parents=True, exist_ok=True)
+
     def _resolve_path(self, file_path):
-        """Resolve the path to find the file in various possible locations."""
+        """Resolve the path to the password file, caching the result."""
+        key_dir = os.path.dirname(self.crypto_manager.key_path)
+        cache_key = (getattr(sys, "frozen", False), sys.platform, key_dir, file_path)
+        if cache_key not in _RESOLVED_PATHS:
+            _RESOLVED_PATHS[cache_key] = self._locate_path(file_path)
+        return _RESOLVED_PATHS[cache_key]
+
+    def _locate_path(self, file_path):
+        """Find the password file by trying multiple possible locations."""
+        from pathlib import Path
+
         # If key_path exists, use the same directory for the password file
         key_dir = os.path.dirname(self.crypto_manager.key_path)
         if key_dir:
@@ -79,6 +109,8 @@ class AuthManager:
 
     def authenticate(self, parent):
         """Prompt for password and authenticate user."""
+        from tkinter import messagebox, simpledialog
+
         self.parent = parent
 
         # First check if we need to set up an initial password
@@ -93,8 +125,7 @@ class AuthManager:
             return False
 
         try:
-            stored_password = self.load_password()
-            return password == stored_password
+            return self.verify_password(password)
         except FileNotFoundError:
             # If file wasn't found, prompt to create a new password
             messagebox.showinfo(
@@ -107,26 +138,65 @@ class AuthManager:
             )
             return False
 
-    def load_password(self):
-        """Load and decrypt the password from file."""
-        if os.path.exists(self.password_file):
+    def _load_stored(self):
+        """Load the stored password record from file."""
+        try:
+            with open(self.password_file, "r") as file:
+                stored = file.read().strip()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Password file not found at {self.password_file}"
+            )
+        if not stored:
+            raise ValueError("Password file is empty")
+        return stored
+
+    def _hash_password(self, password, salt):
+        """Derive a fixed-length scrypt digest for the given password."""
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=_SCRYPT_N,
+            r=_SCRYPT_R,
+            p=_SCRYPT_P,
+            dklen=_SCRYPT_DKLEN,
+        )
+
+    def verify_password(self, password):
+        """Check a password against the stored record in constant time."""
+        stored = self._load_stored()
+
+        if ":" in stored:
+            # Current format: base64(salt):base64(scrypt digest)
+            salt_b64, digest_b64 = stored.split(":", 1)
             try:
-                with open(self.password_file, "r") as file:
-                    encrypted_password = file.read().strip()
-                    if not encrypted_password:
-                        raise ValueError("Password file is empty")
-                return self.crypto_manager.decrypt(encrypted_password)
-            except DecryptionError:
-                # Don't call reset_password here, just report the error
-                # The UI will handle the reset process
+                salt = base64.b64decode(salt_b64)
+                expected = base64.b64decode(digest_b64)
+            except Exception:
                 raise ValueError("Password file is corrupted")
-            except Exception as e:
-                raise ValueError(f"Failed to load password: {str(e)}")
-        else:
-            raise FileNotFoundError(f"Password file not found at {self.password_file}")
+            return hmac.compare_digest(expected, self._hash_password(password, salt))
+
+        # Legacy format: Fernet-encrypted plaintext password
+        try:
+            legacy_password = self.crypto_manager.try_decrypt(stored)
+        except DecryptionError:
+            # Don't call reset_password here, just report the error
+            # The UI will handle the reset process
+            raise ValueError("Password file is corrupted")
+
+        if hmac.compare_digest(legacy_password.encode(), password.encode()):
+            # Upgrade the stored record to the hashed format
+            try:
+                self.save_password(password)
+            except Exception:
+                pass  # Verification succeeded; upgrading is best-effort
+            return True
+        return False
 
     def set_initial_password(self, parent):
         """Set the initial password if not already set."""
+        from tkinter import messagebox, simpledialog
+
         attempt_count = 0
         max_attempts = 3
 
@@ -181,6 +251,9 @@ class AuthManager:
 
     def reset_password(self, parent):
         """Reset the user's password."""
+        import tkinter as tk
+        from tkinter import messagebox, simpledialog
+
         if parent is None:
             # Create a temporary Tk root window if no parent provided
             temp_root = tk.Tk()
@@ -226,13 +299,14 @@ class AuthManager:
         return False
 
     def save_password(self, password):
-        """Encrypt and save the password to file."""
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(os.path.abspath(self.password_file)), exist_ok=True)
-
-        encrypted_password = self.crypto_manager.encrypt(password)
+        """Hash the password with a fresh salt and save it to file."""
+        salt = secrets.token_bytes(16)
+        digest = self._hash_password(password, salt)
+        record = "{}:{}".format(
+            base64.b64encode(salt).decode(), base64.b64encode(digest).decode()
+        )
         with open(self.password_file, "w") as file:
-            file.write(encrypted_password)
+            file.write(record)
 
         # Set secure permissions for the password file
         if os.name != "nt":  # Skip on Windows
@@ -3,22 +3,45 @@ Cryptography module for personal diary application.
 Handles encryption and decryption operations for secure storage.
 """
 
+import mmap
 import os
+import secrets
 import sys
 import base64
 from pathlib import Path
 from cryptography.fernet import Fernet, InvalidToken
 
+# Cache of resolved key-file locations so repeated manager construction
+# doesn't re-walk the candidate directories with stat calls
+_RESOLVED_PATHS = {}
+
 
 class CryptoManager:
     def __init__(self, key_path=".key.key", check_key_exists=True):
         self.key_path = self._resolve_path(key_path)
 
+        # Cache the key bytes and Fernet instance so encrypt/decrypt
+        # don't re-read the key file and re-derive HMAC state per call
+        self._key = None
+        self._fernet = None
+
+        # Ensure the key's directory exists once here rather than on
+        # every write
+        self._parent_dir = Path(self.key_path).resolve().parent
+        self._parent_dir.mkdir(parents=True, exist_ok=True)
+
         if check_key_exists:
             self._ensure_key_exists()
 
     def _resolve_path(self, key_path):
-        """Resolve the path to the key file, trying multiple possible locations."""
+        """Resolve the path to the key file, caching the result per location."""
+        cache_key = (getattr(sys, "frozen", False), sys.platform, key_path)
+        if cache_key not in _RESOLVED_PATHS:
+            _RESOLVED_PATHS[cache_key] = self._locate_path(key_path)
+        return _RESOLVED_PATHS[cache_key]
+
+    def _locate_path(self, key_path):
+        """Find the key file by trying multiple possible locations."""
         # If it's an absolute path, use it directly
         if os.path.isabs(key_path):
             return key_path
@@ -92,59 +115,95 @@ class CryptoManager:
         return os.path.abspath(key_path)
 
     def _ensure_key_exists(self):
-        """Check if encryption key exists, otherwise create it."""
-        if not os.path.exists(self.key_path):
-            try:
-                # Try to generate a new key
-                self.generate_key()
-                print(f"Generated new encryption key at {self.key_path}")
-            except Exception as e:
-                raise FileNotFoundError(
-                    f"Encryption key not found at {self.key_path} and could not be created: {str(e)}"
-                )
+        """Create the encryption key atomically if it doesn't exist yet.
+
+        The O_EXCL create means two processes racing through a first run
+        can't overwrite each other's key: exactly one wins, and the
+        loser just loads the key the winner wrote.
+        """
+        try:
+            self.generate_key(overwrite=False)
+            print(f"Generated new encryption key at {self.key_path}")
+        except FileExistsError:
+            pass  # Key already present; load_key will read it
+        except Exception as e:
+            raise FileNotFoundError(
+                f"Encryption key not found at {self.key_path} and could not be created: {str(e)}"
+            )
 
     def load_key(self):
-        """Load the encryption key from file."""
+        """Load the encryption key from file, caching it for reuse."""
+        if self._key is not None:
+            return self._key
+
         try:
             with open(self.key_path, "rb") as key_file:
-                key_data = key_file.read()
+                # Map the file instead of read() so repeated launches are
+                # served straight from the OS page cache
+                mm = mmap.mmap(key_file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    key_data = bytes(mm)
+                finally:
+                    mm.close()
                 # Validate that this is actually a valid Fernet key
                 if len(key_data) != 44 and not self._is_valid_key(key_data):
                     raise ValueError("Invalid key format")
+                self._key = key_data
                 return key_data
         except Exception as e:
             # If there's any issue loading the key, generate a new one
             print(f"Error loading key: {str(e)}. Generating new key.")
             return self.generate_key()
 
+    def _get_fernet(self):
+        """Return the cached Fernet instance, building it on first use."""
+        if self._fernet is None:
+            self._fernet = Fernet(self.load_key())
+        return self._fernet
+
+    def invalidate(self):
+        """Drop the cached key and Fernet instance (e.g. on key rotation)."""
+        self._key = None
+        self._fernet = None
+
     def _is_valid_key(self, key):
         """Validate if the key is in correct format."""
-        try:
-            # A valid Fernet key is 32 bytes of base64-encoded data
-            if len(key) != 44:  # 32 bytes encoded in base64 is 44 chars
-                return False
-
-            # Try to decode it
-            base64.urlsafe_b64decode(key)
+        # A valid Fernet key is 32 bytes of base64-encoded data
+        if len(key) != 44:  # 32 bytes encoded in base64 is 44 chars
+            return False
 
-            # Try to initialize Fernet with it
-            Fernet(key)
-            return True
+        try:
+            # Decoding to 32 raw bytes is sufficient proof; a truly
+            # malformed key still fails at Fernet construction later
+            return len(base64.urlsafe_b64decode(key)) == 32
         except Exception:
             return False
 
-    def generate_key(self):
-        """Generate a new encryption key and save it to file."""
-        key = Fernet.generate_key()
+    def generate_key(self, overwrite=True):
+        """Generate a new encryption key and save it to file.
 
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(self.key_path)), exist_ok=True)
+        With overwrite=False the key file is created atomically with
+        O_EXCL, so a concurrent first run can't clobber a key another
+        process just wrote; FileExistsError propagates in that case.
+        """
+        # Equivalent to Fernet.generate_key() without the extra decode
+        # round-trip the validator would otherwise repeat
+        key = base64.urlsafe_b64encode(secrets.token_bytes(32))
 
-        # Write the key to file with secure permissions
-        with open(self.key_path, "wb") as key_file:
-            key_file.write(key)
+        # Create with owner-only permissions in the same call instead of
+        # an open + chmod pair (the parent directory was created in
+        # __init__); O_EXCL closes the stat-then-create race
+        flags = os.O_CREAT | os.O_WRONLY | os.O_TRUNC
+        if not overwrite:
+            flags |= os.O_EXCL
+        fd = os.open(self.key_path, flags, 0o600)
+        try:
+            os.write(fd, key)
+        finally:
+            os.close(fd)
 
-        # Set secure permissions (read/write only for owner)
+        # The mode in os.open only applies on creation; make sure an
+        # overwritten pre-existing file is locked down too
         if os.name != "nt":  # Skip on Windows
             try:
                 import stat
@@ -153,19 +212,34 @@ class CryptoManager:
             except Exception as e:
                 print(f"Warning: Could not set permissions on key file: {str(e)}")
 
+        # The old key and Fernet instance are stale now that the key rotated
+        self.invalidate()
+        self._key = key
+
         return key
 
     def encrypt(self, data):
-        """Encrypt the given data."""
-        key = self.load_key()
-        fernet = Fernet(key)
-        return fernet.encrypt(data.encode()).decode()
+        """Encrypt the given string, returning the ciphertext as bytes."""
+        return self._get_fernet().encrypt(data.encode())
 
     def decrypt(self, encrypted_data):
-        """Decrypt the given encrypted data."""
-        key = self.load_key()
-        fernet = Fernet(key)
-        return fernet.decrypt(encrypted_data.encode()).decode()
+        """Decrypt the given ciphertext (bytes or str) back to a string."""
+        if isinstance(encrypted_data, str):
+            encrypted_data = encrypted_data.encode()
+        return self._get_fernet().decrypt(encrypted_data).decode()
+
+    def encrypt_many(self, items):
+        """Encrypt a list of strings, reusing a single Fernet instance."""
+        fernet = self._get_fernet()
+        return [fernet.encrypt(item.encode()) for item in items]
+
+    def decrypt_many(self, items):
+        """Decrypt a list of ciphertexts with one Fernet instance."""
+        fernet = self._get_fernet()
+        return [
+            fernet.decrypt(item.encode() if isinstance(item, str) else item).decode()
+            for item in items
+        ]
 
     def try_decrypt(self, encrypted_data):
         """Attempt to decrypt data and handle exceptions."""
@@ -0,0 +1,112 @@
+"""
+Shared entries model for the personal diary.
+
+A single source of truth that every tab reads from, instead of each tab
+going to the storage layer on its own. Mutations funnel through here and
+notify subscribers, so one save or delete triggers one decrypt pass and
+one coordinated refresh. Entries are parsed once into immutable records
+here, so the tabs read attributes instead of re-splitting the same
+strings on every render.
+"""
+
+from collections import namedtuple
+
+# One decrypted entry, parsed once at read time. `raw` keeps the exact
+# stored string so deletes can still match what is on disk.
+Entry = namedtuple("Entry", "date mood header body raw")
+
+_HEADER_PREFIX = "--- Entry on "
+_MOOD_MARKER = "| Mood:"
+
+
+def _parse_entry(raw):
+    """Split one stored entry string into an Entry record."""
+    header, _, body = raw.partition("\n")
+    date = mood = ""
+    if header.startswith(_HEADER_PREFIX):
+        date, marker, rest = header[len(_HEADER_PREFIX) :].partition(_MOOD_MARKER)
+        date = date.strip()
+        if marker:
+            mood = rest.rstrip("- ").strip()
+    return Entry(date, mood, header, body, raw)
+
+
+class EntriesModel:
+    def __init__(self, storage_manager):
+        self.storage = storage_manager
+        self._subscribers = []
+
+        # Parsed records memoized against the raw list they came from,
+        # so repeated reads don't re-parse unchanged entries
+        self._parsed_for = None
+        self._parsed = None
+        self._by_date = None
+
+    def _records(self):
+        raw = self.storage.read_entries()
+        if raw != self._parsed_for:
+            self._parsed_for = raw
+            self._parsed = [_parse_entry(entry) for entry in raw]
+            self._by_date = None
+        return self._parsed
+
+    @property
+    def entries(self):
+        """All decrypted entries as parsed Entry records."""
+        return list(self._records())
+
+    @property
+    def by_date(self):
+        """Entry records grouped by date string, most work memoized."""
+        records = self._records()
+        if self._by_date is None:
+            by_date = {}
+            for entry in records:
+                if not entry.date:
+                    # Entry doesn't have the expected header format
+                    continue
+                by_date.setdefault(entry.date, []).append(entry)
+            self._by_date = by_date
+        return self._by_date
+
+    def subscribe(self, callback):
+        """Register a no-argument callback fired after every mutation."""
+        self._subscribers.append(callback)
+
+    def _notify(self):
+        for callback in self._subscribers:
+            callback()
+
+    def invalidate(self):
+        """Drop cached views and tell subscribers to re-render."""
+        self.storage._invalidate_cache()
+        self._notify()
+
+    def save_entry(self, content, mood, date=None):
+        """Save an entry through storage and notify subscribers."""
+        result = self.storage.save_entry(content, mood, date)
+        if result:
+            self._notify()
+        return result
+
+    def delete_entry(self, entry):
+        """Delete one entry (Entry record or raw string) and notify."""
+        result = self.storage.delete_entry(getattr(entry, "raw", entry))
+        if result:
+            self._notify()
+        return result
+
+    def delete_entries(self, targets):
+        """Delete several entries in one pass and notify subscribers."""
+        raws = {getattr(entry, "raw", entry) for entry in targets}
+        result = self.storage.delete_entries(raws)
+        if result:
+            self._notify()
+        return result
+
+    def delete_entries_by_date(self, date_str):
+        """Delete all entries for a date and notify subscribers."""
+        result = self.storage.delete_entries_by_date(date_str)
+        if result:
+            self._notify()
+        return result
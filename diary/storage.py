@@ -3,23 +3,79 @@ Storage module for personal diary application.
 Handles reading and writing diary entries.
 """
 
+import atexit
+import hashlib
 import os
+import stat
 import sys
 import shutil
 import datetime
-import tkinter as tk
-from tkinter import ttk
-import tkinter.messagebox as messagebox
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from diary.crypto import CryptoManager, DecryptionError
 
+# Decrypt with a thread pool only past this many lines, so small files
+# don't pay pool startup cost
+_PARALLEL_THRESHOLD = 256
+
+_HEADER_PREFIX = "--- Entry on "
+
+# Owner read/write, computed once instead of on every chmod
+_USER_RW = stat.S_IRUSR | stat.S_IWUSR
+
+# Bytes legal in a Fernet token (urlsafe base64 plus padding). Deleting
+# them with translate leaves nothing for a well-formed line, giving a
+# cheap rejection test for garbage before paying for a failed decrypt.
+_B64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_="
+
+# The smallest Fernet token (version + timestamp + IV + one AES block +
+# HMAC = 73 bytes) base64-encodes to 100 characters
+_MIN_TOKEN_LEN = 100
+
+
+def _entry_date(entry):
+    """Extract the date from an entry's header line, or None.
+
+    Uses partition so only the header is scanned instead of splitting
+    the whole (possibly multi-line) entry body.
+    """
+    header = entry.partition("\n")[0]
+    if not header.startswith(_HEADER_PREFIX):
+        return None
+    return header[len(_HEADER_PREFIX) :].partition("|")[0].strip()
+
 
 class EntryStorage:
     def __init__(self, crypto_manager=None, data_file=".diary_data"):
         self.crypto_manager = crypto_manager or CryptoManager()
 
-        # Resolve path for the data file
+        # Resolve path for the data file and ensure its directory exists
+        # once here instead of on every save
         self.data_file = self._resolve_data_file_path(data_file)
+        os.makedirs(
+            os.path.dirname(os.path.abspath(self.data_file)) or ".", exist_ok=True
+        )
+
+        # Secure permissions only need to be applied when the data file
+        # is first created
+        self._perms_set = os.path.exists(self.data_file)
+
+        # Reused append handle so each save doesn't pay open/close
+        self._append_fp = None
+        atexit.register(self.close)
+
+        # Decrypted-entry caches, so tab switches and repeated lookups
+        # don't re-read and re-decrypt the whole file. The stat snapshot
+        # detects external changes to the data file.
+        self._entries_cache = None
+        self._by_date_cache = None
+        self._cache_stat = None
+        self._cache_meta = None
+
+        # Fingerprint of the last key known to decrypt this file, so
+        # healthy reads can skip the recovery probe scan
+        self._known_good_fp = None
 
         # Check if migration is needed
         self._check_migration()
@@ -55,6 +111,10 @@ class EntryStorage:
         """Check if we need to migrate from old files to new hidden files."""
         # Check if the old data file exists but the new one doesn't
         if os.path.exists("diary_entries.txt") and not os.path.exists(self.data_file):
+            # Imported here so merely loading storage doesn't pull in Tk;
+            # migration is the only remaining UI touchpoint in this module
+            import tkinter.messagebox as messagebox
+
             try:
                 self._migrate_old_entries()
             except Exception as e:
@@ -64,6 +124,8 @@ class EntryStorage:
 
     def _migrate_old_entries(self):
         """Migrate entries from old plaintext file to new encrypted format."""
+        import tkinter.messagebox as messagebox
+
         if not messagebox.askyesno(
             "Migrate Data",
             "Old diary entries found. Would you like to migrate them to the new encrypted format?",
@@ -75,7 +137,8 @@ class EntryStorage:
             with open("diary_entries.txt", "r") as file:
                 old_entries = file.read().split("\n--- Entry on ")
 
-            # Process and save each entry
+            # Process the old entries, then save them in one batch
+            migrated_texts = []
             for i, entry in enumerate(old_entries):
                 if i == 0 and not entry.startswith("--- Entry on "):
                     # Skip initial content if it doesn't start with an entry header
@@ -95,8 +158,12 @@ class EntryStorage:
                 if "--- Entry on " in header:
                     date = header.replace("--- Entry on ", "").replace(" ---", "")
 
-                # Save in new encrypted format
-                self.save_entry(content, "😐 Neutral", date)
+                # Queue in the new encrypted format
+                migrated_texts.append(
+                    f"--- Entry on {date} | Mood: 😐 Neutral ---\n{content}"
+                )
+
+            self.save_entries(migrated_texts)
 
             # Backup old file
             os.rename("diary_entries.txt", "diary_entries.txt.bak")
@@ -108,276 +175,355 @@ class EntryStorage:
         except Exception as e:
             raise StorageError(f"Failed to migrate entries: {str(e)}")
 
+    def _get_append_fp(self):
+        """Return the shared append-mode handle, opening it on first use."""
+        if self._append_fp is None:
+            self._append_fp = open(self.data_file, "ab", buffering=1 << 20)
+        return self._append_fp
+
+    def close(self):
+        """Close the persistent append handle if open."""
+        if self._append_fp is not None:
+            try:
+                self._append_fp.close()
+            finally:
+                self._append_fp = None
+
+    def _data_file_stat(self):
+        """Snapshot the data file's identity for cache validation."""
+        try:
+            st = os.stat(self.data_file)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _invalidate_cache(self):
+        """Drop the decrypted-entry caches after a mutation."""
+        self._entries_cache = None
+        self._by_date_cache = None
+        self._cache_stat = None
+        self._cache_meta = None
+
+    def _fsync_dir(self):
+        """Flush the directory entry after an os.replace, where supported.
+
+        Makes the rename itself durable on POSIX; Windows has no
+        O_DIRECTORY and handles this differently, so it is skipped.
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        try:
+            dir_fd = os.open(
+                os.path.dirname(os.path.abspath(self.data_file)), os.O_DIRECTORY
+            )
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _key_fingerprint(self):
+        """Short, stable digest of the active encryption key."""
+        return hashlib.blake2b(
+            self.crypto_manager.load_key(), digest_size=8
+        ).hexdigest()
+
+    def _key_known_good(self):
+        """Check the sidecar marker recording which key last read this file."""
+        try:
+            with open(self.data_file + ".fp", "r") as fp_file:
+                return fp_file.read().strip() == self._key_fingerprint()
+        except OSError:
+            return False
+
+    def _mark_key_good(self):
+        """Record that the current key decrypts this data file.
+
+        Lets the next read_entries skip the _can_decrypt_any probe, which
+        would otherwise decrypt lines a second time just to test the key.
+        """
+        fingerprint = self._key_fingerprint()
+        if self._known_good_fp == fingerprint:
+            return
+        try:
+            with open(self.data_file + ".fp", "w") as fp_file:
+                fp_file.write(fingerprint)
+            self._known_good_fp = fingerprint
+        except OSError:
+            pass
+
     def save_entry(self, content, mood, date=None):
         """Encrypt and save a diary entry."""
         if not content.strip():
             return False
 
         try:
-            # Make sure the directory exists
-            data_dir = os.path.dirname(os.path.abspath(self.data_file))
-            os.makedirs(data_dir, exist_ok=True)
-
             date = date or datetime.datetime.now().strftime("%B %d, %Y")
             entry_with_metadata = f"--- Entry on {date} | Mood: {mood} ---\n{content}"
             encrypted_entry = self.crypto_manager.encrypt(entry_with_metadata)
 
-            with open(self.data_file, "a") as file:
-                file.write(encrypted_entry + "\n")
-
-            # Set secure permissions for the data file
-            if os.name != "nt":  # Skip on Windows
+            file = self._get_append_fp()
+            file.write(encrypted_entry + b"\n")
+            file.flush()
+
+            # A single append doesn't warrant throwing the caches away
+            # and re-decrypting the whole file on the next read; extend
+            # them in place and re-key them to the file's new stat
+            if self._entries_cache is not None:
+                self._entries_cache.append(entry_with_metadata)
+                if self._by_date_cache is not None:
+                    self._by_date_cache.setdefault(date, []).append(
+                        entry_with_metadata
+                    )
+                if self._cache_meta is not None:
+                    self._cache_meta["total"] += 1
+                self._cache_stat = self._data_file_stat()
+            else:
+                self._invalidate_cache()
+
+            # Set secure permissions when the data file is first created
+            if not self._perms_set and os.name != "nt":  # Skip on Windows
                 try:
-                    import stat
-
-                    os.chmod(self.data_file, stat.S_IRUSR | stat.S_IWUSR)
+                    os.chmod(self.data_file, _USER_RW)
+                    self._perms_set = True
                 except Exception as e:
                     print(f"Warning: Could not set permissions on data file: {str(e)}")
 
+            # The file now contains data written with the current key
+            self._mark_key_good()
             return True
         except Exception as e:
             print(f"Error saving entry: {str(e)}")
             raise StorageError(f"Failed to save entry: {str(e)}")
 
-    def read_entries(self):
-        """Read and decrypt all diary entries."""
-        entries = []
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r") as file:
-                    encrypted_entries = file.readlines()
-
-                    # Check if there are entries that can't be decrypted
-                    if encrypted_entries and not self._can_decrypt_any(
-                        encrypted_entries
-                    ):
-                        # Look for backup or original key files
-                        key_options = []
-
-                        # Check for common key file names
-                        for key_file in [
-                            "key.key",
-                            "key.key.bak",
-                            "key.key.backup",
-                            ".key.key.bak",
-                        ]:
-                            if os.path.exists(key_file):
-                                key_options.append(key_file)
-
-                        if key_options:
-                            selected_key = self._show_key_recovery_dialog(key_options)
-                            if selected_key:
-                                # Backup current key before replacing it
-                                if os.path.exists(".key.key"):
-                                    shutil.copy(".key.key", ".key.key.previous")
-
-                                # Copy the selected key to the active key location
-                                shutil.copy(selected_key, ".key.key")
-                                messagebox.showinfo(
-                                    "Key Restored",
-                                    f"Encryption key has been restored from {selected_key}. "
-                                    "The application will now restart to apply the changes.",
-                                )
-
-                                # Restart the application
-                                python = sys.executable
-                                os.execl(python, python, *sys.argv)
-                                return []  # This line won't be reached due to restart
-                        else:
-                            # No key options found, ask if they want to create a new key
-                            if messagebox.askyesno(
-                                "Decryption Failed",
-                                "Your diary entries cannot be decrypted with the current key, "
-                                "and no backup keys were found.\n\n"
-                                "Would you like to create a backup of your encrypted entries "
-                                "before continuing? (Recommended)",
-                            ):
-                                # Create backup of encrypted entries
-                                self._backup_encrypted_entries()
-
-                    # Try to decrypt each entry
-                    decryption_failures = 0
-                    for encrypted_entry in encrypted_entries:
-                        if encrypted_entry.strip():
-                            try:
-                                decrypted_entry = self.crypto_manager.decrypt(
-                                    encrypted_entry.strip()
-                                )
-                                entries.append(decrypted_entry)
-                            except Exception:
-                                decryption_failures += 1
-                                continue
-
-                    # Alert if there were decryption failures
-                    if decryption_failures > 0 and decryption_failures == len(
-                        encrypted_entries
-                    ):
-                        # All entries failed to decrypt
-                        messagebox.showwarning(
-                            "Decryption Failed",
-                            f"Failed to decrypt any diary entries. The encryption key may have changed.\n"
-                            f"Total entries failed: {decryption_failures}\n\n"
-                            f"To resolve this, find your original key.key file and place it in this folder.",
-                        )
-                    elif decryption_failures > 0:
-                        # Some entries failed
-                        messagebox.showwarning(
-                            "Partial Decryption",
-                            f"Some diary entries could not be decrypted and have been skipped.\n"
-                            f"Entries loaded: {len(entries)}, Entries skipped: {decryption_failures}",
-                        )
+    def save_entries(self, entry_texts):
+        """Encrypt and append many pre-formatted entries in one write.
 
-            except Exception as e:
-                raise StorageError(f"Failed to read diary entries: {str(e)}")
-        return entries
-
-    def _show_key_recovery_dialog(self, key_options):
-        """Show a dialog to let the user select which key to recover from."""
-        dialog = tk.Toplevel()
-        dialog.title("Recover Encryption Key")
-        dialog.geometry("500x300")
-        dialog.configure(bg="#f5f5f5")
-        dialog.grab_set()  # Make dialog modal
-
-        # Create a main frame
-        main_frame = ttk.Frame(dialog)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-        # Add a label
-        ttk.Label(
-            main_frame,
-            text="Your diary entries cannot be decrypted with the current key.\n"
-            "Select a key file to restore:",
-            justify=tk.CENTER,
-        ).pack(pady=10)
-
-        # Create a listbox for the key options
-        key_listbox = tk.Listbox(
-            main_frame,
-            font=("Helvetica", 11),
-            selectbackground="#b3d9ff",
-            selectmode=tk.SINGLE,
-            height=len(key_options) + 1,
-        )
-        key_listbox.pack(fill=tk.X, pady=10)
-
-        # Add the key options to the listbox
-        for key_file in key_options:
-            key_listbox.insert(tk.END, key_file)
-
-        # Add explanation label
-        ttk.Label(
-            main_frame,
-            text="The selected key will replace your current encryption key.\n"
-            "Your current key will be backed up as .key.key.previous",
-            justify=tk.CENTER,
-        ).pack(pady=10)
-
-        # Add button frame
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=10)
-
-        selected_key = [
-            None
-        ]  # List to store the selected key (using list for mutable reference)
-
-        # Function to handle key selection
-        def select_key():
-            selection = key_listbox.curselection()
-            if selection:
-                selected_key[0] = key_options[selection[0]]
-                dialog.destroy()
-
-        # Add buttons
-        ttk.Button(
-            button_frame, text="Use Selected Key", command=select_key, width=20
-        ).pack(side=tk.LEFT, padx=10)
-
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy, width=20).pack(
-            side=tk.RIGHT, padx=10
-        )
+        Used by bulk paths like migration; writes a single joined payload
+        and fsyncs once at the end instead of per entry.
+        """
+        try:
+            encrypted = self.crypto_manager.encrypt_many(list(entry_texts))
+            if not encrypted:
+                return True
 
-        # Center the dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry("{}x{}+{}+{}".format(width, height, x, y))
+            file = self._get_append_fp()
+            file.write(b"\n".join(encrypted) + b"\n")
+            file.flush()
+            os.fsync(file.fileno())
 
-        # Wait for dialog to close
-        dialog.wait_window()
+            # Set secure permissions when the data file is first created
+            if not self._perms_set and os.name != "nt":  # Skip on Windows
+                try:
+                    os.chmod(self.data_file, _USER_RW)
+                    self._perms_set = True
+                except Exception as e:
+                    print(f"Warning: Could not set permissions on data file: {str(e)}")
 
-        return selected_key[0]
+            self._invalidate_cache()
+            self._mark_key_good()
+            return True
+        except Exception as e:
+            raise StorageError(f"Failed to save entries: {str(e)}")
 
-    def _backup_encrypted_entries(self):
-        """Create a backup of the encrypted entries."""
-        if os.path.exists(self.data_file):
-            backup_file = f"{self.data_file}.backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    def iter_entries(self):
+        """Yield decrypted entries one at a time.
+
+        Streams straight from disk with O(1 entry) peak memory, silently
+        skipping lines that cannot be decrypted. Useful for bulk
+        operations like export that don't need the recovery prompts of
+        read_entries.
+        """
+        try:
+            # Binary mode skips newline translation and UTF-8 decoding;
+            # the ciphertext is ASCII and decrypt accepts bytes directly
+            file = open(self.data_file, "rb", buffering=1 << 20)
+        except FileNotFoundError:
+            return
+        with file:
+            decrypt = self.crypto_manager.decrypt
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield decrypt(line)
+                except Exception:
+                    continue
+
+    def read_entries(self, return_meta=False):
+        """Read and decrypt all diary entries.
+
+        Purely I/O and crypto — no dialogs. With return_meta=True, also
+        returns a dict with the ciphertext line total, the decryption
+        failure count and a needs_recovery flag; the UI layer decides
+        how to surface those (see diary.ui.recovery).
+        """
+        current_stat = self._data_file_stat()
+        if self._entries_cache is not None and current_stat == self._cache_stat:
+            # Return a copy so callers that sort in place don't disturb
+            # the cached order
+            entries = list(self._entries_cache)
+            return (entries, dict(self._cache_meta)) if return_meta else entries
+
+        try:
+            # Read the ciphertext as raw bytes; decoding base64 text
+            # through the UTF-8 codec would be pure overhead
+            with open(self.data_file, "rb", buffering=1 << 20) as file:
+                encrypted_entries = file.readlines()
+        except FileNotFoundError:
+            encrypted_entries = []
+        except Exception as e:
+            raise StorageError(f"Failed to read diary entries: {str(e)}")
+
+        # Try to decrypt each entry; Fernet releases the GIL inside
+        # OpenSSL, so large files scale across cores
+        lines = [line.strip() for line in encrypted_entries if line.strip()]
+        entries = [entry for entry in self._decrypt_lines(lines) if entry is not None]
+        meta = {
+            "total": len(lines),
+            "failures": len(lines) - len(entries),
+            # Total failure with a key that never read this file before
+            # points at a wrong key rather than stray corruption
+            "needs_recovery": bool(lines)
+            and not entries
+            and not self._key_known_good(),
+        }
+
+        if entries:
+            self._mark_key_good()
+
+        self._entries_cache = list(entries)
+        self._cache_stat = current_stat
+        self._cache_meta = meta
+        return (entries, dict(meta)) if return_meta else entries
+
+    def _try_decrypt_line(self, line):
+        """Decrypt one ciphertext line, returning None on failure.
+
+        Obviously malformed lines are rejected with a translate-table
+        scan instead of a full HMAC + AES pass through OpenSSL.
+        """
+        if isinstance(line, str):
+            line = line.encode("ascii", "replace")
+        if len(line) < _MIN_TOKEN_LEN or line.translate(None, _B64_ALPHABET):
+            return None
+        try:
+            return self.crypto_manager.decrypt(line)
+        except Exception:
+            return None
+
+    def _decrypt_lines(self, lines):
+        """Decrypt many lines, in parallel for large files.
+
+        Returns results in input order with None for lines that failed.
+        """
+        try_decrypt = self._try_decrypt_line
+        if len(lines) > _PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                return list(executor.map(try_decrypt, lines, chunksize=64))
+        return [try_decrypt(line) for line in lines]
+
+    def backup_encrypted_entries(self):
+        """Copy the encrypted data file aside, returning the backup path.
+
+        Returns None when there is nothing to back up or the copy fails;
+        the caller decides how to tell the user.
+        """
+        backup_file = f"{self.data_file}.backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        try:
+            # EAFP: let the copy report a missing source instead of
+            # stat-ing first and racing against it
+            shutil.copy(self.data_file, backup_file)
+            return backup_file
+        except Exception:
+            return None
+
+    def _rewrite_filtering(self, keep):
+        """Rewrite the data file, keeping lines whose plaintext passes `keep`.
+
+        Surviving ciphertext lines are copied through unchanged, so a
+        delete costs one decrypt per entry and zero re-encrypts. Lines
+        that cannot be decrypted are preserved. The new file is written
+        to a sibling .tmp and moved into place atomically.
+        """
+        tmp_file = self.data_file + ".tmp"
+        try:
+            self.close()
             try:
-                shutil.copy(self.data_file, backup_file)
-                messagebox.showinfo(
-                    "Backup Created",
-                    f"A backup of your encrypted entries has been created at:\n{backup_file}",
-                )
+                source = open(self.data_file, "rb", buffering=1 << 20)
+            except FileNotFoundError:
                 return True
-            except Exception as e:
-                messagebox.showerror(
-                    "Backup Failed", f"Failed to create backup: {str(e)}"
-                )
-                return False
-        return False
 
-    def _can_decrypt_any(self, encrypted_entries):
-        """Test if any entries can be decrypted with the current key."""
-        for entry in encrypted_entries:
-            if not entry.strip():
-                continue
-            try:
-                self.crypto_manager.decrypt(entry.strip())
-                return True  # Successfully decrypted one entry
-            except:
-                continue
-        return False  # Couldn't decrypt any entries
+            with source, open(tmp_file, "wb", buffering=1 << 20) as destination:
+                for line in source:
+                    stripped = line.strip()
+                    if not stripped:
+                        continue
+                    plaintext = self._try_decrypt_line(stripped)
+                    if plaintext is None or keep(plaintext):
+                        destination.write(stripped + b"\n")
+                destination.flush()
+                os.fsync(destination.fileno())
+
+            os.replace(tmp_file, self.data_file)
+            self._fsync_dir()
+            self._invalidate_cache()
+            return True
+        except Exception as e:
+            raise StorageError(f"Failed to rewrite entries: {str(e)}")
 
     def delete_entry(self, entry_to_delete):
         """Delete a specific entry."""
+        return self.delete_entries({entry_to_delete})
+
+    def delete_entries(self, targets):
+        """Delete several entries in one pass over the data file.
+
+        Set membership keeps the filter O(1) per line however many
+        entries are being removed, and the file is rewritten only once.
+        """
+        targets = set(targets)
         try:
-            entries = self.read_entries()
-            entries = [entry for entry in entries if entry != entry_to_delete]
-            return self.rewrite_entries(entries)
+            return self._rewrite_filtering(lambda entry: entry not in targets)
         except Exception as e:
             raise StorageError(f"Failed to delete entry: {str(e)}")
 
     def delete_entries_by_date(self, date_str):
         """Delete all entries for a specific date."""
-        try:
-            entries = self.read_entries()
-            filtered_entries = []
 
-            for entry in entries:
-                try:
-                    header_line = entry.split("\n")[0]
-                    entry_date = (
-                        header_line.split("|")[0].replace("--- Entry on ", "").strip()
-                    )
-                    if entry_date != date_str:
-                        filtered_entries.append(entry)
-                except:
-                    # If we can't parse the date, keep the entry
-                    filtered_entries.append(entry)
+        def keep(entry):
+            entry_date = _entry_date(entry)
+            # If we can't parse the date, keep the entry
+            return entry_date is None or entry_date != date_str
 
-            return self.rewrite_entries(filtered_entries)
+        try:
+            return self._rewrite_filtering(keep)
         except Exception as e:
             raise StorageError(f"Failed to delete entries by date: {str(e)}")
 
     def rewrite_entries(self, entries):
         """Rewrite all entries to the file (used after deletion)."""
         try:
-            with open(self.data_file, "w") as file:
-                for entry in entries:
-                    encrypted_entry = self.crypto_manager.encrypt(entry)
-                    file.write(encrypted_entry + "\n")
+            # The append handle would be left pointing at stale contents
+            self.close()
+
+            # One joined payload, written to a sibling .tmp and moved into
+            # place so a crash mid-write can't truncate the real file.
+            # Single write + fsync + rename instead of per-entry flushes.
+            encrypted = self.crypto_manager.encrypt_many(entries)
+            payload = b"\n".join(encrypted) + b"\n" if encrypted else b""
+            tmp_file = self.data_file + ".tmp"
+            with open(tmp_file, "wb") as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_file, self.data_file)
+            self._fsync_dir()
+
+            self._invalidate_cache()
+            self._mark_key_good()
             return True
         except Exception as e:
             raise StorageError(f"Failed to rewrite entries: {str(e)}")
@@ -385,9 +531,10 @@ class EntryStorage:
     def export_entries(self, export_file):
         """Export all entries to a plain text file."""
         try:
-            entries = self.read_entries()
+            # Stream entry by entry so the whole corpus is never held in
+            # memory at once
             with open(export_file, "w") as destination:
-                for entry in entries:
+                for entry in self.iter_entries():
                     destination.write(entry + "\n\n")
             return True
         except Exception as e:
@@ -395,25 +542,27 @@ class EntryStorage:
 
     def organize_entries_by_date(self):
         """Organize all entries by date."""
-        entries_by_date = {}
+        if (
+            self._by_date_cache is not None
+            and self._data_file_stat() == self._cache_stat
+        ):
+            return self._by_date_cache
+
+        entries_by_date = defaultdict(list)
         entries = self.read_entries()
 
         for entry in entries:
-            try:
-                header_line = entry.split("\n")[0]
-                date_str = (
-                    header_line.split("|")[0].replace("--- Entry on ", "").strip()
-                )
-
-                if date_str in entries_by_date:
-                    entries_by_date[date_str].append(entry)
-                else:
-                    entries_by_date[date_str] = [entry]
-            except:
+            date_str = _entry_date(entry)
+            if date_str is None:
                 # If entry doesn't have expected format, skip it
                 continue
 
-        return entries_by_date
+            entries_by_date[date_str].append(entry)
+
+        # Hand back a plain dict so callers don't accidentally create
+        # empty date buckets by lookup
+        self._by_date_cache = dict(entries_by_date)
+        return self._by_date_cache
 
 
 class StorageError(Exception):
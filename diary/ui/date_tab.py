@@ -6,12 +6,15 @@ from tkinter import ttk
 import tkinter.messagebox as messagebox
 
 class DateViewTab:
-    def __init__(self, parent, storage_manager, status_callback, refresh_callback):
+    def __init__(self, parent, entries_model, status_callback):
         self.parent = parent
-        self.storage_manager = storage_manager
+        self.model = entries_model
         self.status_callback = status_callback
-        self.refresh_callback = refresh_callback
-        
+
+        # Entries grouped by date, saved at load time so selection clicks
+        # don't go back through the storage layer
+        self._entries_by_date = {}
+
         # Main frame
         self.frame = ttk.Frame(parent)
         
@@ -96,15 +99,17 @@ class DateViewTab:
         # Clear the listbox
         self.date_listbox.delete(0, tk.END)
 
-        # Get entries organized by date
-        entries_by_date = self.storage_manager.organize_entries_by_date()
+        # Get entries organized by date and keep them for the click handler
+        entries_by_date = self.model.by_date
+        self._entries_by_date = entries_by_date
         date_list = list(entries_by_date.keys())
         date_list.sort(reverse=True)  # Most recent dates first
 
-        # Populate the listbox with dates
-        for date in date_list:
-            entry_count = len(entries_by_date[date])
-            self.date_listbox.insert(tk.END, f"{date} ({entry_count} entries)")
+        # Populate the listbox with one variadic insert (a single Tcl
+        # call) instead of one round-trip per date
+        items = [f"{date} ({len(entries_by_date[date])} entries)" for date in date_list]
+        if items:
+            self.date_listbox.insert(tk.END, *items)
 
         # Display entries for first date if available
         if date_list:
@@ -125,25 +130,24 @@ class DateViewTab:
         self.date_entry_text.config(state=tk.NORMAL)
         self.date_entry_text.delete(1.0, tk.END)
 
-        # Get entries organized by date
-        entries_by_date = self.storage_manager.organize_entries_by_date()
+        # Use the grouping saved by load_dates; no storage round-trip
+        entries_by_date = self._entries_by_date
 
-        # Display entries for the selected date
+        # Build the whole body as alternating text/tag-list arguments
+        # for one insert call, instead of three inserts per entry. The
+        # tags ride along with their segments, so there's no character
+        # arithmetic for Tk to count differently from Python (emoji in
+        # the headers occupy two Tk index positions each).
         if selected_date in entries_by_date:
+            args = []  # chars, taglist, chars, taglist, ...; () = untagged
             for i, entry in enumerate(entries_by_date[selected_date]):
                 if i > 0:
-                    self.date_entry_text.insert(tk.END, "\n" + "-" * 50 + "\n\n")
-
-                # Split entry into header and content
-                lines = entry.split("\n")
-                header = lines[0]
-                content = "\n".join(lines[1:])
+                    args.extend(("\n" + "-" * 50 + "\n\n", ()))
 
-                # Insert header with styling
-                self.date_entry_text.insert(tk.END, header + "\n\n", "header")
+                # Header and content were split once at parse time
+                args.extend((entry.header, "header", "\n\n", (), entry.body, ()))
 
-                # Insert content
-                self.date_entry_text.insert(tk.END, content)
+            self.date_entry_text.insert(tk.END, *args)
 
         # Make text read-only
         self.date_entry_text.config(state=tk.DISABLED)
@@ -163,9 +167,9 @@ class DateViewTab:
             f"Are you sure you want to delete ALL entries for {selected_date}?",
         ):
             try:
-                if self.storage_manager.delete_entries_by_date(selected_date):
+                if self.model.delete_entries_by_date(selected_date):
+                    self._entries_by_date = {}  # Stale; reloaded via model subscribers
                     self.status_callback(f"All entries for {selected_date} deleted successfully")
-                    self.refresh_callback()  # Refresh all views
                     
                     # Clear the text view
                     self.date_entry_text.config(state=tk.NORMAL)
@@ -5,9 +5,13 @@ Main application window for the personal diary.
 import os
 import sys
 import tkinter as tk
-from tkinter import ttk
+from tkinter import filedialog, ttk
 import tkinter.messagebox as messagebox
 
+from diary.ui.styles import apply_styles
+
+__all__ = ["MainWindow"]
+
 
 class MainWindow:
     def __init__(self, auth_manager, storage_manager, root=None):
@@ -59,36 +63,8 @@ class MainWindow:
 
     def setup_styles(self):
         """Set up the ttk styles for the application."""
-        self.style = ttk.Style()
-
-        # Try to use a more modern theme if available
-        available_themes = self.style.theme_names()
-        if "clam" in available_themes:
-            self.style.theme_use("clam")
-        elif len(available_themes) > 0:
-            # Use the first available theme
-            self.style.theme_use(available_themes[0])
-
-        # Configure styles
-        self.style.configure("TFrame", background="#f5f5f5")
-        self.style.configure(
-            "TButton", font=("Helvetica", 11), background="#4CAF50", foreground="black"
-        )
-        self.style.configure("TLabel", font=("Helvetica", 12), background="#f5f5f5")
-        self.style.configure(
-            "Title.TLabel",
-            font=("Helvetica", 20, "bold"),
-            background="#f5f5f5",
-            foreground="#333333",
-        )
-        self.style.configure(
-            "Date.TLabel",
-            font=("Helvetica", 14),
-            background="#f5f5f5",
-            foreground="#555555",
-        )
-        self.style.configure("TNotebook", background="#f5f5f5")
-        self.style.configure("TNotebook.Tab", font=("Helvetica", 12), padding=[12, 6])
+        # Shared, idempotent setup — see diary.ui.styles
+        self.style = apply_styles(self.root)
 
     def setup_ui(self):
         """Set up the main UI components."""
@@ -141,8 +117,6 @@ class MainWindow:
     def export_entries(self):
         """Export all entries to a text file."""
         try:
-            from tkinter import filedialog
-
             export_file = filedialog.asksaveasfilename(
                 defaultextension=".txt",
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
@@ -0,0 +1,165 @@
+"""
+Key-recovery dialogs for the personal diary.
+
+The storage layer reports decryption problems as plain data; this module
+owns the Tk dialogs that walk the user through restoring a backup key,
+so storage itself stays headless.
+"""
+import os
+import sys
+import shutil
+import tkinter as tk
+from tkinter import ttk
+import tkinter.messagebox as messagebox
+
+# Places earlier versions of the app may have left a usable key
+_KEY_BACKUP_CANDIDATES = ["key.key", "key.key.bak", "key.key.backup", ".key.key.bak"]
+
+
+class UIRecoveryHandler:
+    def __init__(self, storage_manager):
+        self.storage_manager = storage_manager
+
+    def handle_read_result(self, entries, meta):
+        """Surface any decryption problems reported by read_entries.
+
+        Takes the (entries, meta) pair from read_entries(return_meta=True)
+        and raises the appropriate dialogs. May restart the process if
+        the user restores a backup key.
+        """
+        if meta["needs_recovery"]:
+            self._handle_unreadable_file()
+            # Still running: recovery was declined or found no keys
+            messagebox.showwarning(
+                "Decryption Failed",
+                f"Failed to decrypt any diary entries. The encryption key may have changed.\n"
+                f"Total entries failed: {meta['failures']}\n\n"
+                f"To resolve this, find your original key.key file and place it in this folder.",
+            )
+        elif meta["failures"] > 0:
+            messagebox.showwarning(
+                "Partial Decryption",
+                f"Some diary entries could not be decrypted and have been skipped.\n"
+                f"Entries loaded: {len(entries)}, Entries skipped: {meta['failures']}",
+            )
+
+    def _handle_unreadable_file(self):
+        """Offer key restoration from backups, or a ciphertext backup."""
+        key_options = [f for f in _KEY_BACKUP_CANDIDATES if os.path.exists(f)]
+
+        if key_options:
+            selected_key = self._show_key_recovery_dialog(key_options)
+            if selected_key:
+                # Backup current key before replacing it
+                if os.path.exists(".key.key"):
+                    shutil.copy(".key.key", ".key.key.previous")
+
+                # Copy the selected key to the active key location
+                shutil.copy(selected_key, ".key.key")
+                messagebox.showinfo(
+                    "Key Restored",
+                    f"Encryption key has been restored from {selected_key}. "
+                    "The application will now restart to apply the changes.",
+                )
+
+                # Restart the application
+                python = sys.executable
+                os.execl(python, python, *sys.argv)
+        else:
+            # No key options found, ask if they want a ciphertext backup
+            if messagebox.askyesno(
+                "Decryption Failed",
+                "Your diary entries cannot be decrypted with the current key, "
+                "and no backup keys were found.\n\n"
+                "Would you like to create a backup of your encrypted entries "
+                "before continuing? (Recommended)",
+            ):
+                backup_file = self.storage_manager.backup_encrypted_entries()
+                if backup_file:
+                    messagebox.showinfo(
+                        "Backup Created",
+                        f"A backup of your encrypted entries has been created at:\n{backup_file}",
+                    )
+                else:
+                    messagebox.showerror(
+                        "Backup Failed",
+                        "Failed to create a backup of your entries.",
+                    )
+
+    def _show_key_recovery_dialog(self, key_options):
+        """Show a dialog to let the user select which key to recover from."""
+        dialog = tk.Toplevel()
+        dialog.title("Recover Encryption Key")
+        dialog.geometry("500x300")
+        dialog.configure(bg="#f5f5f5")
+        dialog.grab_set()  # Make dialog modal
+
+        # Create a main frame
+        main_frame = ttk.Frame(dialog)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        # Add a label
+        ttk.Label(
+            main_frame,
+            text="Your diary entries cannot be decrypted with the current key.\n"
+            "Select a key file to restore:",
+            justify=tk.CENTER,
+        ).pack(pady=10)
+
+        # Create a listbox for the key options
+        key_listbox = tk.Listbox(
+            main_frame,
+            font=("Helvetica", 11),
+            selectbackground="#b3d9ff",
+            selectmode=tk.SINGLE,
+            height=len(key_options) + 1,
+        )
+        key_listbox.pack(fill=tk.X, pady=10)
+
+        # Add the key options to the listbox in one call
+        key_listbox.insert(tk.END, *key_options)
+
+        # Add explanation label
+        ttk.Label(
+            main_frame,
+            text="The selected key will replace your current encryption key.\n"
+            "Your current key will be backed up as .key.key.previous",
+            justify=tk.CENTER,
+        ).pack(pady=10)
+
+        # Add button frame
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=10)
+
+        selected_key = [
+            None
+        ]  # List to store the selected key (using list for mutable reference)
+
+        # Function to handle key selection
+        def select_key():
+            selection = key_listbox.curselection()
+            if selection:
+                selected_key[0] = key_options[selection[0]]
+                dialog.destroy()
+
+        # Add buttons
+        ttk.Button(
+            button_frame, text="Use Selected Key", command=select_key, width=20
+        ).pack(side=tk.LEFT, padx=10)
+
+        ttk.Button(button_frame, text="Cancel", command=dialog.destroy, width=20).pack(
+            side=tk.RIGHT, padx=10
+        )
+
+        # Center the dialog
+        dialog.update_idletasks()
+        width = dialog.winfo_width()
+        height = dialog.winfo_height()
+        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
+        y = (dialog.winfo_screenheight() // 2) - (height // 2)
+        dialog.geometry("{}x{}+{}+{}".format(width, height, x, y))
+
+        # Wait for dialog to close
+        dialog.wait_window()
+
+        return selected_key[0]
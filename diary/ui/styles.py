@@ -0,0 +1,56 @@
+"""
+Shared ttk style setup for the personal diary.
+
+Theme activation and style.configure are comparatively heavy Tcl
+operations, so all styling funnels through one idempotent apply_styles
+call instead of each window or dialog re-theming on open.
+"""
+from tkinter import ttk
+
+_applied = False
+
+
+def apply_styles(root=None):
+    """Configure the application's ttk styles once per process.
+
+    Safe to call from every window and dialog; repeat calls return
+    immediately. Returns the shared Style object.
+    """
+    global _applied
+    style = ttk.Style(root)
+    if _applied:
+        return style
+    _applied = True
+
+    # Try to use a more modern theme if available, but skip the switch
+    # (an expensive Tcl operation) if it is already active
+    available_themes = style.theme_names()
+    if "clam" in available_themes:
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
+    elif len(available_themes) > 0:
+        # Use the first available theme
+        style.theme_use(available_themes[0])
+
+    # Configure styles
+    style.configure("TFrame", background="#f5f5f5")
+    style.configure(
+        "TButton", font=("Helvetica", 11), background="#4CAF50", foreground="black"
+    )
+    style.configure("TLabel", font=("Helvetica", 12), background="#f5f5f5")
+    style.configure(
+        "Title.TLabel",
+        font=("Helvetica", 20, "bold"),
+        background="#f5f5f5",
+        foreground="#333333",
+    )
+    style.configure(
+        "Date.TLabel",
+        font=("Helvetica", 14),
+        background="#f5f5f5",
+        foreground="#555555",
+    )
+    style.configure("TNotebook", background="#f5f5f5")
+    style.configure("TNotebook.Tab", font=("Helvetica", 12), padding=[12, 6])
+
+    return style
@@ -1,17 +1,35 @@
 """
 View all entries tab component for the personal diary.
 """
+import operator
 import tkinter as tk
 from tkinter import ttk
 import tkinter.messagebox as messagebox
 
+# Entries rendered per page; more are appended as the user scrolls down
+_PAGE_SIZE = 50
+
+
 class ViewAllTab:
-    def __init__(self, parent, storage_manager, status_callback, refresh_callback):
+    def __init__(self, parent, entries_model, status_callback):
         self.parent = parent
-        self.storage_manager = storage_manager
+        self.model = entries_model
         self.status_callback = status_callback
-        self.refresh_callback = refresh_callback
-        
+
+        # Last entry list read from storage and its sorted form, so a
+        # refresh that changed nothing doesn't re-sort
+        self._last_entries = None
+        self._last_sorted = None
+
+        # Virtualized rendering state: only a page of entries is in the
+        # text widget at a time, appended as the user scrolls
+        self._entries = []
+        self._rendered = 0
+
+        # Pooled detail window, built on first use and hidden on close
+        # instead of rebuilding the whole widget tree per view
+        self._detail_win = None
+
         # Main frame
         self.frame = ttk.Frame(parent)
         
@@ -24,8 +42,8 @@ class ViewAllTab:
         all_entries_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         # Add a scrollbar
-        all_entries_scrollbar = ttk.Scrollbar(all_entries_frame)
-        all_entries_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.all_entries_scrollbar = ttk.Scrollbar(all_entries_frame)
+        self.all_entries_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Add a text area for displaying all entries
         self.all_entries_text = tk.Text(
@@ -38,82 +56,164 @@ class ViewAllTab:
             highlightthickness=0,
             bg="#ffffff",
             fg="#333333",
-            yscrollcommand=all_entries_scrollbar.set,
+            yscrollcommand=self._on_text_scroll,
         )
         self.all_entries_text.pack(fill=tk.BOTH, expand=True)
-        all_entries_scrollbar.config(command=self.all_entries_text.yview)
+        self.all_entries_scrollbar.config(command=self.all_entries_text.yview)
+
+        # Render further pages when the widget is resized tall enough
+        self.all_entries_text.bind("<Configure>", self._maybe_render_more)
 
         # Configure text styling
         self.all_entries_text.tag_configure("header", font=("Helvetica", 12, "bold"))
+
+        # Pseudo-button styling for the per-entry [View]/[Delete] links;
+        # text tags are far cheaper than one ttk.Button per entry
+        self.all_entries_text.tag_configure(
+            "btn", foreground="#0066cc", underline=True
+        )
+        self.all_entries_text.tag_bind(
+            "btn", "<Enter>", lambda e: self.all_entries_text.config(cursor="hand2")
+        )
+        self.all_entries_text.tag_bind(
+            "btn", "<Leave>", lambda e: self.all_entries_text.config(cursor="")
+        )
         
     def load_entries(self):
         """Load and display all entries."""
         self.all_entries_text.config(state=tk.NORMAL)
         self.all_entries_text.delete(1.0, tk.END)
 
-        entries = self.storage_manager.read_entries()
-
-        if entries:
-            # Sort entries by date (most recent first)
+        # The shared model memoizes the parsed entries, so repeated
+        # reads here are cheap; we additionally keep the sorted order so
+        # unchanged refreshes skip the sort too
+        entries = self.model.entries
+        if entries == self._last_entries:
+            entries = self._last_sorted
+        else:
+            self._last_entries = list(entries)
+            # Sort entries by date (most recent first); the date was
+            # parsed once at read time, so this compares short strings
             try:
-                entries.sort(key=lambda x: x.split("\n")[0].split("|")[0], reverse=True)
-            except:
+                entries.sort(key=operator.attrgetter("date"), reverse=True)
+            except Exception:
                 pass  # If sorting fails, use original order
+            self._last_sorted = entries
 
-            for i, entry in enumerate(entries):
-                if i > 0:
-                    self.all_entries_text.insert(tk.END, "\n" + "=" * 70 + "\n\n")
-
-                # Split entry into header and content
-                lines = entry.split("\n")
-                header = lines[0]
-                content = "\n".join(lines[1:])
-
-                # Insert header with styling
-                self.all_entries_text.insert(tk.END, header + "\n\n", "header")
-
-                # Insert partial content (first 100 chars)
-                short_content = content[:100] + ("..." if len(content) > 100 else "")
-                self.all_entries_text.insert(tk.END, short_content + "\n\n")
-                
-                # Create a frame for buttons directly
-                button_frame = ttk.Frame(self.all_entries_text)
-                
-                # Insert the frame into the text widget
-                self.all_entries_text.window_create(tk.END, window=button_frame)
-                
-                # Add View button
-                view_button = ttk.Button(
-                    button_frame,
-                    text="View",
-                    width=10,
-                    command=lambda entry=entry: self.view_entry(entry)
-                )
-                view_button.pack(side=tk.LEFT, padx=5)
-                
-                # Add Delete button
-                delete_button = ttk.Button(
-                    button_frame,
-                    text="Delete",
-                    width=10,
-                    command=lambda entry=entry: self.delete_entry(entry)
-                )
-                delete_button.pack(side=tk.LEFT, padx=5)
-                
-                self.all_entries_text.insert(tk.END, "\n")
+        # Render only the first page; scrolling appends the rest, so the
+        # tab-switch cost stays O(page) regardless of diary size
+        self._entries = entries
+        self._rendered = 0
+
+        if entries:
+            self._render_next_page()
         else:
             self.all_entries_text.insert(
                 tk.END, "No diary entries yet. Start writing in the 'Write Entry' tab!"
             )
 
         self.all_entries_text.config(state=tk.DISABLED)  # Make read-only
+
+    def _render_next_page(self, n=_PAGE_SIZE):
+        """Append the next page of entries to the text widget.
+
+        Builds the whole page as alternating text/tag-list arguments for
+        a single insert, so each tag lands exactly on its own segment —
+        no index arithmetic that Tk would count differently from Python
+        for astral-plane characters like the mood emoji — while still
+        crossing the Python/Tcl boundary only once per page.
+        """
+        if self._rendered >= len(self._entries):
+            return
+
+        args = []  # chars, taglist, chars, taglist, ...; () = untagged
+        bindings = []  # (tag, callback)
+        start_index = self._rendered
+        page = self._entries[start_index : start_index + n]
+
+        for i, entry in enumerate(page, start=start_index):
+            if i > 0:
+                args.extend(("\n" + "=" * 70 + "\n\n", ()))
+
+            # Header and content were split once at parse time
+            args.extend((entry.header, "header", "\n\n", ()))
+
+            # Partial content (first 100 chars)
+            content = entry.body
+            short_content = content[:100] + ("..." if len(content) > 100 else "")
+            args.extend((short_content + "\n\n", ()))
+
+            # Clickable pseudo-buttons as tagged segments
+            view_tag = f"view_{i}"
+            delete_tag = f"delete_{i}"
+            args.extend(
+                (
+                    "[View]",
+                    ("btn", view_tag),
+                    "   ",
+                    (),
+                    "[Delete]",
+                    ("btn", delete_tag),
+                    "\n",
+                    (),
+                )
+            )
+            bindings.append((view_tag, lambda e, entry=entry: self.view_entry(entry)))
+            bindings.append(
+                (delete_tag, lambda e, entry=entry: self.delete_entry(entry))
+            )
+
+        # Call straight into Tcl for the hot insert, skipping the Python
+        # wrapper's per-call option normalization
+        text = self.all_entries_text
+        text.config(state=tk.NORMAL)
+        text.tk.call(text._w, "insert", "end", *args)
+        for tag, callback in bindings:
+            text.tag_bind(tag, "<Button-1>", callback)
+        text.config(state=tk.DISABLED)
+
+        self._rendered = start_index + len(page)
+
+    def _maybe_render_more(self, event=None):
+        """Append another page if the view is near the bottom."""
+        if self._rendered >= len(self._entries):
+            return
+        if self.all_entries_text.yview()[1] > 0.9:
+            self._render_next_page()
+
+    def _on_text_scroll(self, first, last):
+        """yscrollcommand hook: update the scrollbar, then page in more."""
+        self.all_entries_scrollbar.set(first, last)
+        if float(last) > 0.9:
+            self._maybe_render_more()
         
-    def view_entry(self, entry_content):
-        """Show a detailed view of an entry."""
+    def view_entry(self, entry):
+        """Show a detailed view of an Entry record in the pooled window."""
+        if self._detail_win is None:
+            self._build_detail_window()
+
+        detail_text = self._detail_text
+        detail_text.config(state=tk.NORMAL)
+        detail_text.delete(1.0, tk.END)
+        detail_text.insert(tk.END, entry.header + "\n\n", "header")
+        detail_text.insert(tk.END, entry.body)
+        detail_text.config(state=tk.DISABLED)
+
+        # Point the Delete button at the entry on display
+        self._detail_delete_button.config(
+            command=lambda: self.delete_and_close(entry, self._detail_win)
+        )
+
+        self._detail_win.deiconify()
+        self._detail_win.lift()
+
+    def _build_detail_window(self):
+        """Build the detail Toplevel once; closing only hides it."""
         detail_window = tk.Toplevel(self.parent)
         detail_window.title("Entry Details")
         detail_window.geometry("600x500")
         detail_window.configure(bg="#f5f5f5")
+        detail_window.protocol("WM_DELETE_WINDOW", detail_window.withdraw)
 
         # Create frame for content
         content_frame = ttk.Frame(detail_window)
@@ -135,26 +235,16 @@ class ViewAllTab:
         )
         detail_text.pack(fill=tk.BOTH, expand=True)
         detail_scrollbar.config(command=detail_text.yview)
-
-        # Insert the entry content
-        lines = entry_content.split("\n")
-        header = lines[0]
-        content = "\n".join(lines[1:])
-
-        detail_text.insert(tk.END, header + "\n\n", "header")
-        detail_text.insert(tk.END, content)
         detail_text.tag_configure("header", font=("Helvetica", 12, "bold"))
-        detail_text.config(state=tk.DISABLED)
 
         # Add button frame
         button_frame = ttk.Frame(detail_window)
         button_frame.pack(fill=tk.X, pady=10)
 
-        # Add delete button
+        # Add delete button (command is rebound per entry in view_entry)
         delete_button = ttk.Button(
             button_frame,
             text="Delete Entry",
-            command=lambda: self.delete_and_close(entry_content, detail_window),
             style="TButton",
             width=15,
         )
@@ -164,24 +254,28 @@ class ViewAllTab:
         close_button = ttk.Button(
             button_frame,
             text="Close",
-            command=detail_window.destroy,
+            command=detail_window.withdraw,
             style="TButton",
             width=15,
         )
         close_button.pack(side=tk.RIGHT, padx=10)
-        
+
+        self._detail_win = detail_window
+        self._detail_text = detail_text
+        self._detail_delete_button = delete_button
+
     def delete_and_close(self, entry, window):
-        """Delete an entry and close the detail window."""
+        """Delete an entry and hide the detail window."""
         if self.delete_entry(entry):
-            window.destroy()
+            window.withdraw()
             
     def delete_entry(self, entry_to_delete):
         """Delete a specific entry."""
         if messagebox.askyesno("Confirm Deletion", "Are you sure you want to delete this entry?"):
             try:
-                if self.storage_manager.delete_entry(entry_to_delete):
+                if self.model.delete_entry(entry_to_delete):
+                    # Model subscribers refresh all views
                     self.status_callback("Entry deleted successfully")
-                    self.refresh_callback()  # Refresh all views
                     return True
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete entry: {str(e)}")
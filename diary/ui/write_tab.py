@@ -9,9 +9,9 @@ import tkinter.messagebox as messagebox
 
 
 class WriteTab:
-    def __init__(self, parent, storage_manager, status_callback):
+    def __init__(self, parent, entries_model, status_callback):
         self.parent = parent
-        self.storage_manager = storage_manager
+        self.model = entries_model
         self.status_callback = status_callback
 
         # Main frame
@@ -21,12 +21,13 @@ class WriteTab:
         self.setup_ui()
 
     def setup_ui(self):
-        # Date label
-        self.current_date = datetime.datetime.now().strftime("%B %d, %Y")
+        # Date label; refreshed at midnight so an app left open overnight
+        # doesn't keep showing (and saving under) yesterday's date
         self.date_label = ttk.Label(
-            self.frame, text=self.current_date, style="Date.TLabel"
+            self.frame, text=self._today(), style="Date.TLabel"
         )
         self.date_label.pack(pady=(0, 20))
+        self._schedule_date_refresh()
 
         # Create a main frame to hold content
         main_frame = ttk.Frame(self.frame)
@@ -100,6 +101,26 @@ class WriteTab:
         )
         clear_button.pack(side=tk.LEFT, padx=10)
 
+    @staticmethod
+    def _today():
+        """Today's date in the header format used by saved entries."""
+        return datetime.datetime.now().strftime("%B %d, %Y")
+
+    def _schedule_date_refresh(self):
+        """Re-arm a timer that updates the date label just past midnight."""
+        now = datetime.datetime.now()
+        midnight = (now + datetime.timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        # A second of slack so the timer fires on the new day
+        ms = int((midnight - now).total_seconds() * 1000) + 1000
+        self.frame.after(ms, self._update_date)
+
+    def _update_date(self):
+        """Refresh the date label and schedule the next midnight update."""
+        self.date_label.config(text=self._today())
+        self._schedule_date_refresh()
+
     def save_entry(self):
         """Save the current diary entry."""
         content = self.text_area.get("1.0", tk.END).strip()
@@ -110,15 +131,14 @@ class WriteTab:
             return False
 
         try:
-            if self.storage_manager.save_entry(
-                content, self.mood_var.get(), self.current_date
-            ):
+            # Date is computed at save time, not frozen at tab creation
+            if self.model.save_entry(content, self.mood_var.get(), self._today()):
                 self.text_area.delete("1.0", tk.END)
                 messagebox.showinfo(
                     "Saved", "Your diary entry has been securely saved!"
                 )
                 self.status_callback("Entry saved and encrypted")
-                # Signal tab change to update views
+                # Model subscribers refresh the other views
                 return True
             else:
                 messagebox.showerror("Error", "Failed to save entry.")
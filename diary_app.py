@@ -6,45 +6,155 @@ This module ties together all components and provides the entry point.
 import os
 import sys
 import tkinter as tk
-from tkinter import ttk
-import tkinter.messagebox as messagebox
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from diary.crypto import CryptoManager
 from diary.auth import AuthManager
+from diary.entries_model import EntriesModel
 from diary.storage import EntryStorage
-from diary.ui.main_window import MainWindow
-from diary.ui.write_tab import WriteTab
-from diary.ui.view_tab import ViewAllTab
-from diary.ui.date_tab import DateViewTab
+
+# The ttk, messagebox and diary.ui imports are deferred into the
+# branches that first need them, so the happy startup path (migration
+# done, key present, no errors) doesn't pay for widget modules it may
+# never show
+
+
+# Buffer for the portable copy fallback; 256 KiB cuts the number of
+# read/write syscalls fourfold over the stdlib's 64 KiB default
+_COPY_BUFSIZE = 256 * 1024
+
+
+def _fastcopy(src, dst):
+    """Copy a file using the fastest primitive the platform offers.
+
+    Tries the in-kernel zero-copy paths (copy_file_range, then sendfile)
+    before falling back to a buffered readinto loop, so migration copies
+    never shuttle data through Python-level buffers when the kernel can
+    move it directly.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+
+        if size and hasattr(os, "copy_file_range"):
+            # Only fall back if the very first call is refused; a failure
+            # mid-copy must propagate rather than restart another way
+            try:
+                copied = os.copy_file_range(infd, outfd, size)
+            except OSError:
+                copied = -1
+            if copied >= 0:
+                while 0 < copied < size:
+                    copied += os.copy_file_range(infd, outfd, size - copied)
+                if copied:
+                    return
+
+        if size and hasattr(os, "sendfile"):
+            try:
+                offset = os.sendfile(outfd, infd, 0, size)
+            except OSError:
+                offset = -1
+            if offset >= 0:
+                while 0 < offset < size:
+                    offset += os.sendfile(outfd, infd, offset, size - offset)
+                if offset:
+                    return
+
+        # Portable fallback: one reused buffer, no per-chunk allocation
+        mv = memoryview(bytearray(_COPY_BUFSIZE))
+        while True:
+            n = fsrc.readinto(mv)
+            if not n:
+                break
+            fdst.write(mv[:n])
 
 
 class DiaryApplication:
+    # Fixed attribute set: skips the per-instance dict and catches
+    # attribute-name typos at assignment time
+    __slots__ = (
+        "root",
+        "crypto_manager",
+        "auth_manager",
+        "storage_manager",
+        "entries_model",
+        "main_window",
+        "notebook",
+        "write_tab",
+        "view_all_tab",
+        "date_view_tab",
+        "_screen_w",
+        "_screen_h",
+        "_executor",
+        "_pending_tab",
+        "_dirty",
+        "_idle_scheduled",
+    )
+
     def __init__(self):
         # Initialize application by setting up root window first
         # This is important to prevent Toplevel errors
         self.root = tk.Tk()
         self.root.withdraw()  # Hide main window until we're fully initialized
 
-        try:
-            # First, check if we need to migrate from old to new hidden files
-            self.check_and_migrate_files()
-
-            # Initialize crypto manager first
-            self.crypto_manager = CryptoManager()
+        # Screen size queried once; dialog centering reuses it instead
+        # of a render-measure-remap round trip per dialog
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
 
-            # Get the actual path being used
-            key_path = self.crypto_manager.key_path
+        self.main_window = None
 
-            # Check if key exists, otherwise generate one
-            if not os.path.exists(key_path):
+        try:
+            # One crypto manager for the whole app; constructed without
+            # the key check since the key may still live at its legacy
+            # path until migration below has run. The dialog path owns
+            # key creation, so nothing auto-generates behind its back.
+            self.crypto_manager = CryptoManager(check_key_exists=False)
+
+            # Check if we need to migrate from old to new hidden files;
+            # the check already stats the key, so reuse its answer
+            key_present = self.check_and_migrate_files()
+
+            # Check if key exists, otherwise generate one. The dialog is
+            # non-blocking: its generate callback resumes startup via
+            # _post_key_setup inside the one main event loop, instead of
+            # spinning a nested wait_window loop.
+            if not key_present:
                 self.create_key_generation_dialog()
+            else:
+                self._post_key_setup()
+        except Exception as e:
+            # Handle initialization errors
+            from tkinter import messagebox
+
+            messagebox.showerror(
+                "Initialization Error", f"Failed to start application: {str(e)}"
+            )
+            self.root.destroy()
+            sys.exit(1)
+
+    def _post_key_setup(self):
+        """Finish startup once an encryption key is available."""
+        from diary.ui.main_window import MainWindow
+        from diary.ui.recovery import UIRecoveryHandler
 
+        try:
             # Initialize other managers
             self.auth_manager = AuthManager(self.crypto_manager)
             self.storage_manager = EntryStorage(self.crypto_manager)
 
+            # Do the first read here, where we can walk the user through
+            # key recovery if it fails; storage itself never raises
+            # dialogs. This also warms the decrypted-entry cache.
+            entries, meta = self.storage_manager.read_entries(return_meta=True)
+            UIRecoveryHandler(self.storage_manager).handle_read_result(entries, meta)
+
+            # Single parsed view of the entries shared by all tabs;
+            # mutations notify subscribers so one change = one refresh
+            self.entries_model = EntriesModel(self.storage_manager)
+            self.entries_model.subscribe(self.refresh_views)
+
             # Create the main window
             self.main_window = MainWindow(
                 self.auth_manager, self.storage_manager, root=self.root
@@ -55,8 +165,15 @@ class DiaryApplication:
 
             # Now show the main window
             self.root.deiconify()
+
+            # Warm the derived entry views shortly after first paint so
+            # the first click on a view tab renders from caches instead
+            # of paying the parse and grouping cost while the user waits
+            self.root.after(100, self._warm_caches)
         except Exception as e:
             # Handle initialization errors
+            from tkinter import messagebox
+
             messagebox.showerror(
                 "Initialization Error", f"Failed to start application: {str(e)}"
             )
@@ -64,67 +181,91 @@ class DiaryApplication:
             sys.exit(1)
 
     def check_and_migrate_files(self):
-        """Check if old files exist and migrate them to new hidden files."""
-        crypto_manager = CryptoManager(check_key_exists=False)
-        key_path = crypto_manager.key_path
+        """Check if old files exist and migrate them to new hidden files.
+
+        Returns True if the key file exists once migration has run, so
+        the caller doesn't have to stat it again.
+        """
+        key_path = self.crypto_manager.key_path
 
         # Determine the directory for the new key file
         key_dir = os.path.dirname(key_path)
+        pwd_path = os.path.join(key_dir, ".password.txt")
 
-        # Check for old key file in current directory
-        if os.path.exists("key.key") and not os.path.exists(key_path):
+        # One directory scan per location instead of one stat per path
+        key_name = os.path.basename(key_path)
+        new_names = {key_name, ".password.txt"}
+        try:
+            present = {e.name for e in os.scandir(key_dir or ".") if e.name in new_names}
+        except OSError:
+            present = set()
+
+        # Steady state: both hidden files already exist, nothing to do
+        if new_names <= present:
+            return True
+
+        # One loop over both legacy files, with the results batched into
+        # a single summary dialog instead of one modal per file. The
+        # rename is attempted directly rather than stat'ing the legacy
+        # names first: a missing old file just raises FileNotFoundError,
+        # so the usual no-legacy-files case costs no extra syscalls.
+        migrations = [
+            ("key.key", key_name, key_path, "Encryption key"),
+            ("password.txt", ".password.txt", pwd_path, "Password file"),
+        ]
+        pending = [m for m in migrations if m[1] not in present]
+        migrated = []
+        errors = []
+
+        if pending and key_dir:
+            # Create the destination directory once, not per file
+            os.makedirs(key_dir, exist_ok=True)
+
+        for old_name, new_name, new_path, label in pending:
             try:
-                # Create directory if it doesn't exist
-                os.makedirs(key_dir, exist_ok=True)
-
-                # Copy the file to maintain the same key
-                shutil.copy("key.key", key_path)
-                messagebox.showinfo(
-                    "Migration",
-                    f"Encryption key migrated to {key_path}.\n"
-                    "The original key.key file can now be deleted.",
-                )
+                # Rename instead of copying: atomic and metadata-only on
+                # the same filesystem, with a copy+unlink fallback across
+                # devices
+                try:
+                    os.replace(old_name, new_path)
+                except FileNotFoundError:
+                    continue  # Nothing to migrate for this file
+                except OSError:
+                    _fastcopy(old_name, new_path)
+                    os.unlink(old_name)
+                present.add(new_name)
+                migrated.append(f"{label} migrated to {new_path}.")
             except Exception as e:
-                messagebox.showerror(
-                    "Migration Error", f"Failed to migrate key file: {str(e)}"
-                )
+                errors.append(f"Failed to migrate {old_name}: {str(e)}")
 
-        # Similarly for password file
-        # Get the appropriate path for password file
-        pwd_path = os.path.join(key_dir, ".password.txt")
+        if migrated or errors:
+            from tkinter import messagebox
 
-        # Check for old password file
-        if os.path.exists("password.txt") and not os.path.exists(pwd_path):
-            try:
-                # Create directory if it doesn't exist
-                os.makedirs(key_dir, exist_ok=True)
+            if migrated:
+                messagebox.showinfo("Migration", "\n".join(migrated))
+            if errors:
+                messagebox.showerror("Migration Error", "\n".join(errors))
 
-                # Copy the file to maintain the same password
-                shutil.copy("password.txt", pwd_path)
-                messagebox.showinfo(
-                    "Migration",
-                    f"Password file migrated to {pwd_path}.\n"
-                    "The original password.txt file can now be deleted.",
-                )
-            except Exception as e:
-                messagebox.showerror(
-                    "Migration Error", f"Failed to migrate password file: {str(e)}"
-                )
+        return key_name in present
 
     def create_key_generation_dialog(self):
         """Create a dialog for key generation."""
-        # Create a simple dialog window
+        from tkinter import ttk
+
+        from diary.ui.styles import apply_styles
+
+        # Create a simple dialog window, centered up front so it maps
+        # once in its final position instead of jumping after a remeasure
         dialog = tk.Toplevel(self.root)
         dialog.title("Generate Encryption Key")
-        dialog.geometry("400x200")
+        x = (self._screen_w - 400) // 2
+        y = (self._screen_h - 200) // 2
+        dialog.geometry(f"400x200+{x}+{y}")
         dialog.configure(bg="#f5f5f5")
         dialog.grab_set()  # Make dialog modal
 
-        # Set up styling
-        style = ttk.Style()
-        style.configure("TFrame", background="#f5f5f5")
-        style.configure("TButton", font=("Helvetica", 11))
-        style.configure("TLabel", font=("Helvetica", 12), background="#f5f5f5")
+        # Set up styling (no-op if another window already applied it)
+        apply_styles(self.root)
 
         # Create a main frame
         main_frame = ttk.Frame(dialog)
@@ -140,6 +281,8 @@ class DiaryApplication:
 
         # Add the generate key button
         def generate_key():
+            from tkinter import messagebox
+
             try:
                 # Generate a new key using our already initialized crypto manager
                 self.crypto_manager.generate_key()
@@ -148,6 +291,8 @@ class DiaryApplication:
                     f"Encryption key generated and saved at:\n{self.crypto_manager.key_path}",
                 )
                 dialog.destroy()
+                # Resume startup now that the key exists
+                self._post_key_setup()
             except Exception as e:
                 messagebox.showerror(
                     "Error", f"Failed to generate encryption key: {str(e)}"
@@ -158,80 +303,148 @@ class DiaryApplication:
         )
         generate_button.pack(pady=10)
 
-        # Add a close button
+        # Add a close button; destroying the root ends the mainloop
         close_button = ttk.Button(
-            main_frame, text="Exit", command=lambda: sys.exit(1), width=20
+            main_frame, text="Exit", command=self.root.destroy, width=20
         )
         close_button.pack(pady=10)
 
-        # Center the dialog on the screen
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry("{}x{}+{}+{}".format(width, height, x, y))
-
-        # Wait for dialog to close
-        dialog.wait_window()
-
-        # Check if key was created
-        if not os.path.exists(self.crypto_manager.key_path):
-            messagebox.showerror(
-                "Error",
-                f"Key generation failed. Cannot continue without an encryption key at {self.crypto_manager.key_path}",
-            )
-            sys.exit(1)
+        # Closing the dialog without a key leaves nothing to show
+        dialog.protocol("WM_DELETE_WINDOW", self.root.destroy)
 
     def setup_tabs(self):
         """Set up the notebook tabs for the application."""
+        from tkinter import ttk
+
+        from diary.ui.write_tab import WriteTab
+
         # Create notebook
         self.notebook = ttk.Notebook(self.main_window.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        # Create tabs
+        # Only the write tab is built eagerly; each view tab costs a full
+        # widget tree, so they are constructed on first selection and the
+        # notebook holds empty placeholder frames until then
         self.write_tab = WriteTab(
-            self.notebook, self.storage_manager, self.main_window.set_status
-        )
-
-        self.view_all_tab = ViewAllTab(
-            self.notebook,
-            self.storage_manager,
-            self.main_window.set_status,
-            self.refresh_views,
-        )
-
-        self.date_view_tab = DateViewTab(
-            self.notebook,
-            self.storage_manager,
-            self.main_window.set_status,
-            self.refresh_views,
+            self.notebook, self.entries_model, self.main_window.set_status
         )
+        self.view_all_tab = None
+        self.date_view_tab = None
 
         # Add tabs to notebook
         self.notebook.add(self.write_tab.get_frame(), text="Write Entry")
-        self.notebook.add(self.view_all_tab.get_frame(), text="View All Entries")
-        self.notebook.add(self.date_view_tab.get_frame(), text="View By Date")
+        self.notebook.add(ttk.Frame(self.notebook), text="View All Entries")
+        self.notebook.add(ttk.Frame(self.notebook), text="View By Date")
 
         # Bind tab change event
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
 
+        # Worker that warms the decrypted-entry cache off the Tk thread;
+        # <<EntriesLoaded>> brings the result back to the mainloop, where
+        # all widget updates happen
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_tab = None
+        self.root.bind("<<EntriesLoaded>>", self._on_entries_loaded)
+
+        # Dirty flags let refresh_views repaint only the visible tab and
+        # collapse bursts of refreshes into one idle callback
+        self._dirty = {1: False, 2: False}
+        self._idle_scheduled = False
+
+    def _warm_caches(self):
+        """Precompute the parsed and grouped entry views off the UI thread.
+
+        The decrypted-entry cache is already warm from the startup read;
+        this fills in the model's parse memo and by-date grouping, which
+        touch no Tk state and so can run on the worker.
+        """
+
+        def warm():
+            try:
+                self.entries_model.by_date
+            except Exception:
+                pass  # Purely an optimization; tabs rebuild on demand
+
+        self._executor.submit(warm)
+
+    def _ensure_tab_built(self, tab_id):
+        """Swap a placeholder for the real view tab on first selection."""
+        if tab_id == 1 and self.view_all_tab is None:
+            from diary.ui.view_tab import ViewAllTab
+
+            self.view_all_tab = ViewAllTab(
+                self.notebook, self.entries_model, self.main_window.set_status
+            )
+            self._swap_tab(1, self.view_all_tab.get_frame(), "View All Entries")
+        elif tab_id == 2 and self.date_view_tab is None:
+            from diary.ui.date_tab import DateViewTab
+
+            self.date_view_tab = DateViewTab(
+                self.notebook, self.entries_model, self.main_window.set_status
+            )
+            self._swap_tab(2, self.date_view_tab.get_frame(), "View By Date")
+
+    def _swap_tab(self, index, frame, text):
+        """Replace the placeholder at `index` with the real tab frame."""
+        placeholder = self.notebook.tabs()[index]
+        self.notebook.forget(placeholder)
+        self.notebook.insert(index, frame, text=text)
+        self.notebook.select(index)
+
     def on_tab_change(self, event):
         """Handle tab change events."""
         tab_id = self.notebook.index(self.notebook.select())
-        if tab_id == 1:  # View All Entries tab
+        if tab_id in (1, 2):  # View All Entries / View By Date tabs
+            self._ensure_tab_built(tab_id)
+            # Decrypt in the worker so a large diary doesn't freeze the
+            # UI; the event handler then renders from the warm cache
+            self._pending_tab = tab_id
+            future = self._executor.submit(self.storage_manager.read_entries)
+            future.add_done_callback(
+                lambda f: self.root.event_generate("<<EntriesLoaded>>", when="tail")
+            )
+
+    def _on_entries_loaded(self, event):
+        """Render the pending tab on the main thread after a worker read."""
+        if self._pending_tab == 1 and self.view_all_tab is not None:
             self.view_all_tab.load_entries()
-        elif tab_id == 2:  # View By Date tab
+            self._dirty[1] = False
+        elif self._pending_tab == 2 and self.date_view_tab is not None:
             self.date_view_tab.load_dates()
+            self._dirty[2] = False
+        self._pending_tab = None
 
     def refresh_views(self):
-        """Refresh all views that display entries."""
-        self.view_all_tab.load_entries()
-        self.date_view_tab.load_dates()
+        """Mark the entry views stale and repaint the visible one when idle.
+
+        The hidden tab keeps its dirty flag and reloads on next
+        selection, so one save/delete costs one decrypt pass, not two.
+        """
+        self._dirty[1] = True
+        self._dirty[2] = True
+        if not self._idle_scheduled:
+            self._idle_scheduled = True
+            self.root.after_idle(self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Refresh whichever dirty tab is currently visible."""
+        self._idle_scheduled = False
+        tab_id = self.notebook.index(self.notebook.select())
+        if tab_id == 1 and self._dirty[1] and self.view_all_tab is not None:
+            self.view_all_tab.load_entries()
+            self._dirty[1] = False
+        elif tab_id == 2 and self._dirty[2] and self.date_view_tab is not None:
+            self.date_view_tab.load_dates()
+            self._dirty[2] = False
 
     def run(self):
-        """Run the application."""
-        self.main_window.run()
+        """Run the application's event loop.
+
+        When the key-generation dialog is up, the rest of startup
+        completes from its callback inside this same loop.
+        """
+        self.root.protocol("WM_DELETE_WINDOW", self.root.destroy)
+        self.root.mainloop()
 
 
 def main():
@@ -241,6 +454,8 @@ def main():
         app.run()
     except Exception as e:
         # Catch any unexpected errors
+        from tkinter import messagebox
+
         root = tk.Tk()
         root.withdraw()
         messagebox.showerror("Fatal Error", f"An unexpected error occurred: {str(e)}")
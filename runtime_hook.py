@@ -0,0 +1,24 @@
+"""
+PyInstaller runtime hook for Personal Diary.
+
+Warms up CryptoManager path resolution on a background thread while the
+bootloader is still bringing up tkinter, so the resolved key location
+(and any platform app-data directories it creates) are ready by the time
+the application constructs its managers. Key generation itself is left
+to the app so the first-run dialog flow is unchanged.
+"""
+
+import threading
+
+
+def _warm_crypto():
+    try:
+        from diary.crypto import CryptoManager
+
+        CryptoManager(check_key_exists=False)
+    except Exception:
+        # Warming is best-effort; real errors surface in the app itself
+        pass
+
+
+threading.Thread(target=_warm_crypto, name="crypto-warmup", daemon=True).start()
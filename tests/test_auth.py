@@ -0,0 +1,43 @@
+"""
+Tests for password storage and verification.
+"""
+
+import os
+import sys
+
+# Add the parent directory to sys.path to allow importing diary modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from diary.auth import AuthManager
+from diary.crypto import CryptoManager
+
+
+def _make_auth(tmp_path):
+    key_path = str(tmp_path / "test.key")
+    crypto = CryptoManager(key_path=key_path, check_key_exists=False)
+    crypto.generate_key()
+    return AuthManager(crypto, password_file=str(tmp_path / ".password.txt"))
+
+
+def test_password_verify_roundtrip(tmp_path):
+    """Saved passwords verify, and wrong passwords are rejected."""
+    auth = _make_auth(tmp_path)
+    auth.save_password("correct horse")
+
+    assert auth.verify_password("correct horse") is True
+    assert auth.verify_password("wrong horse") is False
+
+
+def test_legacy_password_upgrade(tmp_path):
+    """Old Fernet-encrypted password files still verify and are upgraded."""
+    auth = _make_auth(tmp_path)
+
+    # Write a record in the legacy encrypted-plaintext format
+    with open(auth.password_file, "wb") as f:
+        f.write(auth.crypto_manager.encrypt("secret"))
+
+    assert auth.verify_password("secret") is True
+
+    # The stored record should now be in salt:digest form
+    with open(auth.password_file) as f:
+        assert ":" in f.read()
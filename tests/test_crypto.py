@@ -46,6 +46,25 @@ def test_crypto_key_generation():
             os.remove(temp_key_path)
 
 
+def test_crypto_batch_roundtrip():
+    """Test batch encryption and decryption of multiple items."""
+    temp_key_path = "temp_test_batch_key.key"
+
+    try:
+        crypto = CryptoManager(key_path=temp_key_path, check_key_exists=False)
+        crypto.generate_key()
+
+        originals = ["first entry", "second entry", "third entry"]
+        encrypted = crypto.encrypt_many(originals)
+        decrypted = crypto.decrypt_many(encrypted)
+
+        assert len(encrypted) == len(originals)
+        assert decrypted == originals
+    finally:
+        if os.path.exists(temp_key_path):
+            os.remove(temp_key_path)
+
+
 def test_path_resolution():
     """Test that path resolution works correctly."""
     crypto = CryptoManager(check_key_exists=False)
@@ -0,0 +1,45 @@
+"""
+Tests for the shared entries model.
+"""
+import pytest
+
+from diary.crypto import CryptoManager
+from diary.entries_model import EntriesModel, _parse_entry
+from diary.storage import EntryStorage
+
+
+@pytest.fixture
+def model(tmp_path):
+    crypto = CryptoManager(key_path=str(tmp_path / ".key.key"))
+    storage = EntryStorage(crypto_manager=crypto, data_file=".diary_data")
+    return EntriesModel(storage)
+
+
+def test_parse_entry_fields():
+    raw = "--- Entry on May 01, 2026 | Mood: 😊 Happy ---\nhello\nworld"
+    entry = _parse_entry(raw)
+    assert entry.date == "May 01, 2026"
+    assert entry.mood == "😊 Happy"
+    assert entry.header == "--- Entry on May 01, 2026 | Mood: 😊 Happy ---"
+    assert entry.body == "hello\nworld"
+    assert entry.raw == raw
+
+
+def test_entries_are_parsed_records(model):
+    assert model.save_entry("first entry", "😐 Neutral", date="May 01, 2026")
+
+    entries = model.entries
+    assert len(entries) == 1
+    assert entries[0].date == "May 01, 2026"
+    assert entries[0].body == "first entry"
+    assert model.by_date["May 01, 2026"] == entries
+
+
+def test_delete_entry_accepts_record(model):
+    model.save_entry("drop me", "😐 Neutral", date="May 01, 2026")
+    notified = []
+    model.subscribe(lambda: notified.append(True))
+
+    assert model.delete_entry(model.entries[0])
+    assert notified
+    assert model.entries == []
@@ -0,0 +1,45 @@
+"""
+Tests for the storage layer.
+"""
+import pytest
+
+from diary.crypto import CryptoManager
+from diary.storage import EntryStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    crypto = CryptoManager(key_path=str(tmp_path / ".key.key"))
+    return EntryStorage(crypto_manager=crypto, data_file=".diary_data")
+
+
+def test_save_and_read_roundtrip(storage):
+    assert storage.save_entry("first entry", "😐 Neutral", date="May 01, 2026")
+    assert storage.save_entry("second entry", "😊 Happy", date="May 02, 2026")
+
+    entries = storage.read_entries()
+    assert len(entries) == 2
+    assert entries[0].endswith("first entry")
+    assert entries[1].startswith("--- Entry on May 02, 2026")
+
+
+def test_read_meta_reports_failures(storage):
+    storage.save_entry("good entry", "😐 Neutral", date="May 01, 2026")
+    with open(storage.data_file, "ab") as file:
+        file.write(b"not-a-valid-token\n")
+
+    entries, meta = storage.read_entries(return_meta=True)
+    assert len(entries) == 1
+    assert meta["total"] == 2
+    assert meta["failures"] == 1
+    assert not meta["needs_recovery"]
+
+
+def test_delete_entries_by_date(storage):
+    storage.save_entry("keep me", "😐 Neutral", date="May 01, 2026")
+    storage.save_entry("drop me", "😐 Neutral", date="May 02, 2026")
+
+    assert storage.delete_entries_by_date("May 02, 2026")
+    entries = storage.read_entries()
+    assert len(entries) == 1
+    assert entries[0].endswith("keep me")